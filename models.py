@@ -2,11 +2,16 @@
 Data models and database logic for the Academic Deadline Tracker.
 """
 import sqlite3
+import itertools
 import json
 import os
+import threading
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, asdict
+from contextlib import contextmanager
+from typing import Iterator, List, NamedTuple, Optional, Dict, Any, Tuple
+from dataclasses import dataclass
+
+from utils import parse_iso_datetime
 
 
 @dataclass
@@ -19,31 +24,163 @@ class Task:
     course: str = ""
     priority: str = "medium"  # low, medium, high
     reminder_time: Optional[str] = None  # ISO format datetime string
-    completed: bool = False
+    completed: int = 0  # 0 = pending, 1 = completed, as stored in SQLite
     created_at: str = ""  # ISO format datetime string
 
+    @property
+    def due_dt(self) -> Optional[datetime]:
+        """Parsed due date, or None if it is empty or invalid."""
+        return self._parsed_datetime('due_date')
+
+    @property
+    def reminder_dt(self) -> Optional[datetime]:
+        """Parsed reminder time, or None if it is unset or invalid."""
+        return self._parsed_datetime('reminder_time')
+
+    def _parsed_datetime(self, field_name: str) -> Optional[datetime]:
+        """Parse an ISO datetime field once and reuse it until the field changes."""
+        value = getattr(self, field_name)
+        cache_key = f"_{field_name}_parsed"
+        cached = self.__dict__.get(cache_key)
+        if cached is None or cached[0] is not value:
+            try:
+                parsed = parse_iso_datetime(value) if value else None
+            except ValueError:
+                parsed = None
+            cached = (value, parsed)
+            self.__dict__[cache_key] = cached
+        return cached[1]
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert task to dictionary."""
-        return asdict(self)
+        # Built by hand: asdict() deep-copies every field, which is wasted
+        # work for a flat record of strings and scalars
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'due_date': self.due_date,
+            'course': self.course,
+            'priority': self.priority,
+            'reminder_time': self.reminder_time,
+            'completed': self.completed,
+            'created_at': self.created_at
+        }
+
+    def to_summary(self) -> 'TaskSummary':
+        """Convert task to the lightweight view used by task lists."""
+        return TaskSummary(self.id, self.title, self.course, self.due_date, self.priority, self.completed)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Task':
         """Create task from dictionary."""
         return cls(**data)
 
+    @classmethod
+    def from_row(cls, row: Tuple[Any, ...]) -> 'Task':
+        """Create task from a database row in column order."""
+        # Assign fields straight from the row; this is the hot path for list
+        # queries and skips the keyword-argument __init__ call per row
+        task = cls.__new__(cls)
+        (
+            task.id,
+            task.title,
+            task.description,
+            task.due_date,
+            task.course,
+            task.priority,
+            task.reminder_time,
+            task.completed,
+            task.created_at
+        ) = row
+        return task
+
+
+class TaskSummary(NamedTuple):
+    """Lightweight view of a task holding only the columns shown in task lists."""
+    id: int
+    title: str
+    course: str
+    due_date: str
+    priority: str
+    completed: int
+
 
 class DatabaseManager:
     """Manages SQLite database operations for tasks."""
     
+    # SQL used on every UI refresh is kept as constants so each statement text
+    # is identical across calls and stays hot in the connection's statement cache
+    _TASK_COLUMNS = "id, title, description, due_date, course, priority, reminder_time, completed, created_at"
+    _SQL_INSERT_PREFIX = (
+        "INSERT INTO tasks (title, description, due_date, course, priority, reminder_time, completed, created_at) "
+        "VALUES "
+    )
+    _SQL_INSERT_ROW = "(?, ?, ?, ?, ?, ?, ?, ?)"
+    _SQL_INSERT = _SQL_INSERT_PREFIX + _SQL_INSERT_ROW
+    _SQL_UPDATE = (
+        "UPDATE tasks SET title = ?, description = ?, due_date = ?, course = ?, "
+        "priority = ?, reminder_time = ?, completed = ? WHERE id = ?"
+    )
+    _SQL_DELETE = "DELETE FROM tasks WHERE id = ?"
+    _SQL_GET = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?"
+    _SQL_GET_ALL = f"SELECT {_TASK_COLUMNS} FROM tasks ORDER BY due_ts ASC"
+    _SQL_GET_BY_STATUS = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE completed = ? ORDER BY due_ts ASC"
+    _SQL_GET_SUMMARIES = "SELECT id, title, course, due_date, priority, completed FROM tasks ORDER BY due_ts ASC"
+    
+    # Integer sort key derived from due_date so ordering is numeric rather than
+    # lexicographic. The stored local time is read as UTC, which keeps the
+    # order intact; the value is not meant to be shown to the user.
+    _DUE_TS_COLUMN = "due_ts INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', due_date) AS INTEGER)) VIRTUAL"
+    
+    # 8 columns x 100 rows stays well under SQLite's 999 bound parameter limit
+    _IMPORT_BATCH_SIZE = 100
+    _SQL_INSERT_BATCH = _SQL_INSERT_PREFIX + ", ".join([_SQL_INSERT_ROW] * _IMPORT_BATCH_SIZE)
+    
     def __init__(self, db_path: str = "tasks.db"):
         self.db_path = db_path
+        # One long-lived connection shared by every method; the lock serializes
+        # access from the UI thread and the notification thread. It is
+        # re-entrant so methods can be called inside transaction().
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=128
+        )
+        self._lock = threading.RLock()
         self.init_database()
     
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Group several operations into a single transaction.
+        
+        Commits when the block exits normally and rolls back if it raises.
+        Nested calls join the outer transaction.
+        """
+        with self._lock:
+            if self._conn.in_transaction:
+                yield self._conn
+                return
+            
+            self._conn.execute("BEGIN")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+    
     def init_database(self) -> None:
         """Initialize the database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+        with self._lock:
+            self._conn.execute(f"""
                 CREATE TABLE IF NOT EXISTS tasks (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     title TEXT NOT NULL,
@@ -53,20 +190,31 @@ class DatabaseManager:
                     priority TEXT DEFAULT 'medium',
                     reminder_time TEXT,
                     completed BOOLEAN DEFAULT FALSE,
-                    created_at TEXT NOT NULL
+                    created_at TEXT NOT NULL,
+                    {self._DUE_TS_COLUMN}
                 )
             """)
-            conn.commit()
+            # Databases created before due_ts existed get the column added
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_xinfo(tasks)")}
+            if "due_ts" not in columns:
+                self._conn.execute(f"ALTER TABLE tasks ADD COLUMN {self._DUE_TS_COLUMN}")
+            # Serve the pending/completed lists and the full list in due-date
+            # order straight from an index instead of scanning and sorting
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_completed_due_ts ON tasks(completed, due_ts)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_due_ts ON tasks(due_ts)")
+            # WAL lets the notification thread read while the UI writes, and
+            # synchronous=NORMAL drops the extra fsync per commit. The journal
+            # mode persists in the file; the rest apply to this connection.
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA cache_size=-64000")
+            self._conn.execute("PRAGMA mmap_size=268435456")
     
     def add_task(self, task: Task) -> int:
         """Add a new task to the database."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO tasks (title, description, due_date, course, priority, reminder_time, completed, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        with self._lock:
+            cursor = self._conn.execute(self._SQL_INSERT, (
                 task.title,
                 task.description,
                 task.due_date,
@@ -76,22 +224,12 @@ class DatabaseManager:
                 task.completed,
                 task.created_at
             ))
-            conn.commit()
             return cursor.lastrowid
-        finally:
-            conn.close()
     
     def update_task(self, task: Task) -> None:
         """Update an existing task."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE tasks SET
-                    title = ?, description = ?, due_date = ?, course = ?,
-                    priority = ?, reminder_time = ?, completed = ?
-                WHERE id = ?
-            """, (
+        with self._lock:
+            self._conn.execute(self._SQL_UPDATE, (
                 task.title,
                 task.description,
                 task.due_date,
@@ -101,129 +239,95 @@ class DatabaseManager:
                 task.completed,
                 task.id
             ))
-            conn.commit()
-        finally:
-            conn.close()
     
     def delete_task(self, task_id: int) -> None:
         """Delete a task by ID."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-            conn.commit()
-        finally:
-            conn.close()
+        with self._lock:
+            self._conn.execute(self._SQL_DELETE, (task_id,))
     
     def get_task(self, task_id: int) -> Optional[Task]:
         """Retrieve a task by ID."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
-            row = cursor.fetchone()
-            if row:
-                return Task(
-                    id=row[0],
-                    title=row[1],
-                    description=row[2],
-                    due_date=row[3],
-                    course=row[4],
-                    priority=row[5],
-                    reminder_time=row[6],
-                    completed=bool(row[7]),
-                    created_at=row[8]
-                )
-            return None
-        finally:
-            conn.close()
+        with self._lock:
+            row = self._conn.execute(self._SQL_GET, (task_id,)).fetchone()
+        if row:
+            return Task.from_row(row)
+        return None
     
     def get_all_tasks(self) -> List[Task]:
         """Retrieve all tasks."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM tasks ORDER BY due_date ASC")
-            rows = cursor.fetchall()
-            return [
-                Task(
-                    id=row[0],
-                    title=row[1],
-                    description=row[2],
-                    due_date=row[3],
-                    course=row[4],
-                    priority=row[5],
-                    reminder_time=row[6],
-                    completed=bool(row[7]),
-                    created_at=row[8]
-                )
-                for row in rows
-            ]
-        finally:
-            conn.close()
+        with self._lock:
+            rows = self._conn.execute(self._SQL_GET_ALL).fetchall()
+        return [Task.from_row(row) for row in rows]
     
     def get_pending_tasks(self) -> List[Task]:
         """Retrieve all pending (not completed) tasks."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM tasks WHERE completed = 0 ORDER BY due_date ASC")
-            rows = cursor.fetchall()
-            return [
-                Task(
-                    id=row[0],
-                    title=row[1],
-                    description=row[2],
-                    due_date=row[3],
-                    course=row[4],
-                    priority=row[5],
-                    reminder_time=row[6],
-                    completed=bool(row[7]),
-                    created_at=row[8]
-                )
-                for row in rows
-            ]
-        finally:
-            conn.close()
+        with self._lock:
+            rows = self._conn.execute(self._SQL_GET_BY_STATUS, (0,)).fetchall()
+        return [Task.from_row(row) for row in rows]
     
     def get_completed_tasks(self) -> List[Task]:
         """Retrieve all completed tasks."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM tasks WHERE completed = 1 ORDER BY due_date ASC")
-            rows = cursor.fetchall()
-            return [
-                Task(
-                    id=row[0],
-                    title=row[1],
-                    description=row[2],
-                    due_date=row[3],
-                    course=row[4],
-                    priority=row[5],
-                    reminder_time=row[6],
-                    completed=bool(row[7]),
-                    created_at=row[8]
-                )
-                for row in rows
-            ]
-        finally:
-            conn.close()
+        with self._lock:
+            rows = self._conn.execute(self._SQL_GET_BY_STATUS, (1,)).fetchall()
+        return [Task.from_row(row) for row in rows]
+    
+    def get_task_summaries(self) -> List[TaskSummary]:
+        """Retrieve the list-view columns of all tasks, without descriptions."""
+        with self._lock:
+            rows = self._conn.execute(self._SQL_GET_SUMMARIES).fetchall()
+        return [TaskSummary._make(row) for row in rows]
     
     def export_tasks(self, filepath: str) -> None:
         """Export all tasks to a JSON file."""
-        tasks = self.get_all_tasks()
-        task_dicts = [task.to_dict() for task in tasks]
-        with open(filepath, 'w') as f:
-            json.dump(task_dicts, f, indent=2)
+        # SQLite builds the JSON document itself, so no Task objects or
+        # intermediate dicts are created on the Python side
+        with self._lock:
+            (document,) = self._conn.execute("""
+                SELECT json_group_array(json_object(
+                    'id', id,
+                    'title', title,
+                    'description', description,
+                    'due_date', due_date,
+                    'course', course,
+                    'priority', priority,
+                    'reminder_time', reminder_time,
+                    'completed', json(CASE WHEN completed THEN 'true' ELSE 'false' END),
+                    'created_at', created_at
+                ))
+                FROM (SELECT * FROM tasks ORDER BY due_ts ASC)
+            """).fetchone()
+        with open(filepath, 'w', encoding="utf-8") as f:
+            f.write(document)
     
     def import_tasks(self, filepath: str) -> None:
         """Import tasks from a JSON file."""
-        with open(filepath, 'r') as f:
+        with open(filepath, 'r', encoding="utf-8") as f:
             task_dicts = json.load(f)
         
-        for task_dict in task_dicts:
-            # Remove id to allow creation of new records
-            task_dict.pop('id', None)
-            task = Task.from_dict(task_dict)
-            self.add_task(task)
\ No newline at end of file
+        # Rows are produced lazily from the parsed JSON; any id in the file is
+        # ignored so new records are created
+        rows = (
+            (
+                task_dict.get('title', ""),
+                task_dict.get('description', ""),
+                task_dict.get('due_date', ""),
+                task_dict.get('course', ""),
+                task_dict.get('priority', "medium"),
+                task_dict.get('reminder_time'),
+                task_dict.get('completed', False),
+                task_dict.get('created_at', "")
+            )
+            for task_dict in task_dicts
+        )
+        
+        # Insert everything in one transaction so the import commits once.
+        # Full batches go through a single multi-row INSERT each; the final
+        # partial batch is handled by executemany.
+        batch_size = self._IMPORT_BATCH_SIZE
+        with self.transaction() as conn:
+            while True:
+                batch = list(itertools.islice(rows, batch_size))
+                if len(batch) < batch_size:
+                    conn.executemany(self._SQL_INSERT, batch)
+                    break
+                conn.execute(self._SQL_INSERT_BATCH, [value for row in batch for value in row])
\ No newline at end of file
@@ -4,26 +4,27 @@ Handles both Firebase Cloud Messaging and local notifications.
 """
 import os
 import json
+import heapq
+import importlib.util
+import itertools
 import threading
-import time
-from datetime import datetime
-from typing import Optional, Dict, Any
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Tuple, Union
 
-try:
-    from plyer import notification as plyer_notification
-    PLYER_AVAILABLE = True
-except ImportError:
-    PLYER_AVAILABLE = False
+from utils import parse_iso_datetime
+
+# Only check that the optional libraries are installed here; they are slow to
+# import, so the actual imports happen the first time they are needed.
+PLYER_AVAILABLE = importlib.util.find_spec("plyer") is not None
+if not PLYER_AVAILABLE:
     print("Plyer not available, local notifications disabled")
 
-try:
-    import firebase_admin
-    from firebase_admin import messaging
-    FIREBASE_AVAILABLE = True
-except ImportError:
-    FIREBASE_AVAILABLE = False
+FIREBASE_AVAILABLE = importlib.util.find_spec("firebase_admin") is not None
+if not FIREBASE_AVAILABLE:
     print("Firebase Admin SDK not available, FCM notifications disabled")
 
+_ZERO = timedelta(0)
+
 
 class NotificationManager:
     """Manages sending notifications via Firebase or local system."""
@@ -32,8 +33,15 @@ class NotificationManager:
         self.config_file = config_file
         self.firebase_enabled = False
         self.local_enabled = True
+        self._messaging = None
         self._initialize_firebase()
-        self.scheduled_notifications = {}
+        self.scheduled_notifications: Dict[int, Dict[str, Any]] = {}
+        # Min-heap of (time, sequence, task_id) so the worker can sleep until
+        # the earliest reminder. Cancelled or rescheduled entries stay in the
+        # heap and are skipped when their sequence no longer matches.
+        self._schedule_heap: List[Tuple[datetime, int, int]] = []
+        self._schedule_sequence = itertools.count()
+        self._condition = threading.Condition()
         self.notification_thread = None
         self.running = False
     
@@ -44,9 +52,13 @@ class NotificationManager:
             
         if os.path.exists(self.config_file):
             try:
+                import firebase_admin
+                from firebase_admin import messaging
+                
                 # Initialize Firebase only if not already initialized
                 if not firebase_admin._apps:
                     firebase_admin.initialize_app()
+                self._messaging = messaging
                 self.firebase_enabled = True
                 print("Firebase initialized successfully")
             except Exception as e:
@@ -71,14 +83,14 @@ class NotificationManager:
             return False
             
         try:
-            message = messaging.Message(
-                notification=messaging.Notification(
+            message = self._messaging.Message(
+                notification=self._messaging.Notification(
                     title=title,
                     body=body
                 ),
                 token=token
             )
-            response = messaging.send(message)
+            response = self._messaging.send(message)
             print(f"Successfully sent FCM message: {response}")
             return True
         except Exception as e:
@@ -100,6 +112,8 @@ class NotificationManager:
             return False
             
         try:
+            from plyer import notification as plyer_notification
+            
             plyer_notification.notify(
                 title=title,
                 message=body,
@@ -128,29 +142,36 @@ class NotificationManager:
         # Fallback to local notification
         self.send_local_notification(title, body)
     
-    def schedule_notification(self, task_id: int, reminder_time_str: str, title: str, body: str) -> None:
+    def schedule_notification(self, task_id: int, reminder_time: Union[str, datetime], title: str, body: str) -> None:
         """
         Schedule a notification for a specific time.
         
         Args:
             task_id: Task identifier
-            reminder_time_str: ISO format datetime string
+            reminder_time: ISO format datetime string, or an already parsed datetime
             title: Notification title
             body: Notification body
         """
         try:
-            reminder_time = datetime.fromisoformat(reminder_time_str)
-            self.scheduled_notifications[task_id] = {
-                'time': reminder_time,
-                'title': title,
-                'body': body
-            }
+            if isinstance(reminder_time, str):
+                reminder_time = parse_iso_datetime(reminder_time)
+            sequence = next(self._schedule_sequence)
+            with self._condition:
+                self.scheduled_notifications[task_id] = {
+                    'time': reminder_time,
+                    'title': title,
+                    'body': body,
+                    'sequence': sequence
+                }
+                heapq.heappush(self._schedule_heap, (reminder_time, sequence, task_id))
+                # Wake the worker in case this is now the earliest reminder
+                self._condition.notify()
             
             # Start notification thread if not already running
             if not self.running:
                 self.start_notification_service()
         except ValueError:
-            print(f"Invalid reminder time format: {reminder_time_str}")
+            print(f"Invalid reminder time format: {reminder_time}")
     
     def cancel_scheduled_notification(self, task_id: int) -> None:
         """
@@ -159,7 +180,8 @@ class NotificationManager:
         Args:
             task_id: Task identifier
         """
-        self.scheduled_notifications.pop(task_id, None)
+        with self._condition:
+            self.scheduled_notifications.pop(task_id, None)
     
     def start_notification_service(self) -> None:
         """Start the background notification service."""
@@ -173,30 +195,57 @@ class NotificationManager:
     
     def stop_notification_service(self) -> None:
         """Stop the background notification service."""
-        self.running = False
+        with self._condition:
+            self.running = False
+            self._condition.notify()
         if self.notification_thread:
             self.notification_thread.join()
         print("Notification service stopped")
     
     def _notification_worker(self) -> None:
-        """Background worker that checks for due notifications."""
+        """Background worker that sleeps until the next notification is due."""
+        while True:
+            with self._condition:
+                notification_data = self._wait_for_due_notification()
+            if notification_data is None:
+                return
+            
+            # Send outside the lock so scheduling from the UI never blocks on it
+            self.send_local_notification(
+                notification_data['title'],
+                notification_data['body']
+            )
+    
+    def _wait_for_due_notification(self) -> Optional[Dict[str, Any]]:
+        """
+        Block until a scheduled notification is due and remove it from the schedule.
+        
+        Must be called with the condition's lock held.
+        
+        Returns:
+            The due notification data, or None if the service was stopped
+        """
         while self.running:
-            now = datetime.now()
-            due_notifications = []
+            if not self._schedule_heap:
+                self._condition.wait()
+                continue
             
-            # Check for due notifications
-            for task_id, notification_data in list(self.scheduled_notifications.items()):
-                if notification_data['time'] <= now:
-                    due_notifications.append((task_id, notification_data))
+            reminder_time, sequence, task_id = self._schedule_heap[0]
+            notification_data = self.scheduled_notifications.get(task_id)
+            if notification_data is None or notification_data['sequence'] != sequence:
+                # Cancelled or rescheduled since this entry was pushed
+                heapq.heappop(self._schedule_heap)
+                continue
             
-            # Send due notifications
-            for task_id, notification_data in due_notifications:
-                self.send_local_notification(
-                    notification_data['title'],
-                    notification_data['body']
-                )
-                # Remove sent notification
-                self.scheduled_notifications.pop(task_id, None)
+            # Compare timedeltas directly; seconds are only needed to wait
+            delay = reminder_time - datetime.now()
+            if delay > _ZERO:
+                # Waits longer than TIMEOUT_MAX raise OverflowError; waking
+                # early is harmless since the heap is re-checked
+                self._condition.wait(timeout=min(delay.total_seconds(), threading.TIMEOUT_MAX))
+                continue
             
-            # Sleep for a minute before checking again
-            time.sleep(60)
\ No newline at end of file
+            heapq.heappop(self._schedule_heap)
+            del self.scheduled_notifications[task_id]
+            return notification_data
+        return None
\ No newline at end of file
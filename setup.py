@@ -1,6 +1,8 @@
 """
 Setup script for the Academic Deadline Tracker.
 """
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -9,6 +11,13 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = fh.read().splitlines()
 
+# Set ADT_USE_MYPYC=1 to compile utils.py into a C extension with mypyc
+# (requires mypy). The pure Python module is used otherwise.
+ext_modules = []
+if os.environ.get("ADT_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["--ignore-missing-imports", "utils.py"])
+
 setup(
     name="academic-deadline-tracker",
     version="1.0.0",
@@ -31,6 +40,7 @@ setup(
     ],
     python_requires=">=3.10",
     install_requires=requirements,
+    ext_modules=ext_modules,
     entry_points={
         "console_scripts": [
             "academic-deadline-tracker=main:main",
@@ -1,8 +1,10 @@
 import unittest
 import tempfile
+import json
 import os
 import sqlite3
 import time
+from dataclasses import asdict
 from datetime import datetime, timedelta
 
 from models import Task, DatabaseManager
@@ -53,6 +55,7 @@ class TestTask(unittest.TestCase):
         self.assertIsInstance(task_dict, dict)
         self.assertEqual(task_dict['id'], 1)
         self.assertEqual(task_dict['title'], "Test Task")
+        self.assertEqual(task_dict, asdict(task))
     
     def test_task_from_dict(self):
         """Test creating task from dictionary."""
@@ -72,6 +75,49 @@ class TestTask(unittest.TestCase):
         self.assertEqual(task.id, 1)
         self.assertEqual(task.title, "Test Task")
         self.assertEqual(task.description, "Test Description")
+    
+    def test_task_from_row(self):
+        """Test creating task from a database row."""
+        row = (
+            1,
+            "Test Task",
+            "Test Description",
+            "2025-12-31T23:59:59",
+            "Mathematics",
+            "high",
+            None,
+            1,
+            "2025-01-01T00:00:00"
+        )
+        
+        task = Task.from_row(row)
+        self.assertEqual(task, Task(
+            id=1,
+            title="Test Task",
+            description="Test Description",
+            due_date="2025-12-31T23:59:59",
+            course="Mathematics",
+            priority="high",
+            reminder_time=None,
+            completed=1,
+            created_at="2025-01-01T00:00:00"
+        ))
+    
+    def test_task_parsed_datetimes(self):
+        """Test that parsed datetimes are cached and follow field changes."""
+        task = Task(
+            due_date="2025-12-31T23:59:59",
+            reminder_time="invalid-date"
+        )
+        
+        self.assertEqual(task.due_dt, datetime(2025, 12, 31, 23, 59, 59))
+        self.assertIs(task.due_dt, task.due_dt)
+        self.assertIsNone(task.reminder_dt)
+        
+        task.due_date = "2026-01-01T08:00:00"
+        self.assertEqual(task.due_dt, datetime(2026, 1, 1, 8, 0))
+        task.due_date = ""
+        self.assertIsNone(task.due_dt)
 
 
 class TestDatabaseManager(unittest.TestCase):
@@ -87,6 +133,8 @@ class TestDatabaseManager(unittest.TestCase):
     
     def tearDown(self):
         """Tear down test fixtures."""
+        self.db.close()
+        
         # Clean up the temporary database
         if os.path.exists(self.db_path):
             # On Windows, we might need to wait for the file to be released
@@ -104,6 +152,92 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertIsInstance(tasks, list)
         self.assertEqual(len(tasks), 0)
     
+    def test_close(self):
+        """Test that the connection is unusable after closing."""
+        self.db.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.db.get_all_tasks()
+        
+        # Reopen so tearDown can close it again
+        self.db = DatabaseManager(self.db_path)
+    
+    def test_get_all_tasks_sorted_by_due_date(self):
+        """Test that tasks come back in chronological due date order."""
+        # Listed in lexicographic order, which is the reverse of chronological
+        # order: " " sorts before "T", and 09:00+05:00 is 04:00 UTC
+        due_dates = ["2025-06-01 08:00:00", "2025-06-01T07:00:00", "2025-06-01T09:00:00+05:00"]
+        for i, due_date in enumerate(due_dates):
+            task = Task(
+                title=f"Test Task {i}",
+                due_date=due_date,
+                created_at="2025-01-01T00:00:00"
+            )
+            self.db.add_task(task)
+        
+        tasks = self.db.get_all_tasks()
+        self.assertEqual([task.due_date for task in tasks], due_dates[::-1])
+    
+    def test_init_database_migrates_existing_table(self):
+        """Test that a database created without due_ts gains the column."""
+        self.db.close()
+        os.unlink(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                description TEXT,
+                due_date TEXT NOT NULL,
+                course TEXT,
+                priority TEXT DEFAULT 'medium',
+                reminder_time TEXT,
+                completed BOOLEAN DEFAULT FALSE,
+                created_at TEXT NOT NULL
+            )
+        """)
+        conn.execute(
+            "INSERT INTO tasks (title, due_date, created_at) VALUES (?, ?, ?)",
+            ("Old Task", "2025-12-31T23:59:59", "2025-01-01T00:00:00")
+        )
+        conn.commit()
+        conn.close()
+        
+        self.db = DatabaseManager(self.db_path)
+        
+        tasks = self.db.get_all_tasks()
+        self.assertEqual([task.title for task in tasks], ["Old Task"])
+        self.db.add_task(Task(title="New Task", due_date="2025-06-30T12:00:00", created_at="2025-01-01T00:00:00"))
+        self.assertEqual([task.title for task in self.db.get_all_tasks()], ["New Task", "Old Task"])
+    
+    def test_transaction_commits(self):
+        """Test that operations inside a transaction are committed together."""
+        with self.db.transaction():
+            for i in range(3):
+                self.db.add_task(Task(
+                    title=f"Test Task {i}",
+                    due_date="2025-12-31T23:59:59",
+                    created_at="2025-01-01T00:00:00"
+                ))
+        
+        self.assertEqual(len(self.db.get_all_tasks()), 3)
+    
+    def test_transaction_rolls_back_on_error(self):
+        """Test that a failing transaction discards all of its operations."""
+        task_id = self.db.add_task(Task(title="Test Task", due_date="2025-12-31T23:59:59", created_at="2025-01-01T00:00:00"))
+        
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                self.db.delete_task(task_id)
+                with self.db.transaction():
+                    self.db.add_task(Task(
+                        title="Nested Task",
+                        due_date="2025-12-31T23:59:59",
+                        created_at="2025-01-01T00:00:00"
+                    ))
+                raise RuntimeError("abort")
+        
+        self.assertEqual([task.title for task in self.db.get_all_tasks()], ["Test Task"])
+    
     def test_add_task(self):
         """Test adding a task to the database."""
         task = Task(
@@ -273,6 +407,149 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(len(completed_tasks), 2)
         for task in completed_tasks:
             self.assertTrue(task.completed)
+    
+    def test_get_task_summaries(self):
+        """Test retrieving list-view summaries of all tasks."""
+        for i in range(2):
+            task = Task(
+                title=f"Test Task {i}",
+                description=f"Test Description {i}",
+                due_date=f"2025-12-3{1 - i}T23:59:59",
+                course="Mathematics",
+                priority="high",
+                completed=bool(i),
+                created_at="2025-01-01T00:00:00"
+            )
+            self.db.add_task(task)
+        
+        summaries = self.db.get_task_summaries()
+        self.assertEqual(
+            [(s.title, s.course, s.due_date, s.priority, s.completed) for s in summaries],
+            [
+                ("Test Task 1", "Mathematics", "2025-12-30T23:59:59", "high", 1),
+                ("Test Task 0", "Mathematics", "2025-12-31T23:59:59", "high", 0)
+            ]
+        )
+        self.assertEqual([s.id for s in summaries], [task.id for task in self.db.get_all_tasks()])
+        
+        # A full task converts to the same summary the database returns
+        self.assertEqual([task.to_summary() for task in self.db.get_all_tasks()], summaries)
+    
+    def test_export_tasks(self):
+        """Test that exported JSON matches the stored tasks."""
+        for i in range(2):
+            task = Task(
+                title=f"Test Task {i}",
+                description=f"Test Description {i}",
+                due_date=f"2025-12-3{1 - i}T23:59:59",
+                course="Mathematics",
+                priority="high",
+                reminder_time="2025-12-30T23:59:59" if i else None,
+                completed=bool(i),
+                created_at="2025-01-01T00:00:00"
+            )
+            self.db.add_task(task)
+        
+        export_path = self.db_path + ".json"
+        self.addCleanup(os.unlink, export_path)
+        self.db.export_tasks(export_path)
+        
+        with open(export_path, 'r', encoding="utf-8") as f:
+            exported = json.load(f)
+        self.assertEqual(exported, [task.to_dict() for task in self.db.get_all_tasks()])
+        self.assertIs(exported[0]['completed'], True)
+    
+    def test_export_import_tasks(self):
+        """Test exporting tasks to JSON and importing them back."""
+        for i in range(3):
+            task = Task(
+                title=f"Test Task {i}",
+                description=f"Test Description {i}",
+                due_date=f"2025-12-2{i}T23:59:59",
+                course="Mathematics",
+                priority="high",
+                completed=(i == 0),
+                created_at="2025-01-01T00:00:00"
+            )
+            self.db.add_task(task)
+        
+        export_path = self.db_path + ".json"
+        self.addCleanup(os.unlink, export_path)
+        self.db.export_tasks(export_path)
+        self.db.import_tasks(export_path)
+        
+        tasks = self.db.get_all_tasks()
+        self.assertEqual(len(tasks), 6)
+        self.assertEqual(len(set(task.id for task in tasks)), 6)
+        self.assertEqual(
+            [task.title for task in tasks],
+            ["Test Task 0", "Test Task 0", "Test Task 1", "Test Task 1", "Test Task 2", "Test Task 2"]
+        )
+        self.assertEqual(len(self.db.get_completed_tasks()), 2)
+    
+    def test_export_import_non_ascii(self):
+        """Test that non-ASCII text survives an export/import round trip."""
+        task = Task(
+            title="Café 数学",
+            description="Überprüfung — ∑",
+            due_date="2025-12-31T23:59:59",
+            course="Mathématiques",
+            created_at="2025-01-01T00:00:00"
+        )
+        self.db.add_task(task)
+        
+        export_path = self.db_path + ".json"
+        self.addCleanup(os.unlink, export_path)
+        self.db.export_tasks(export_path)
+        
+        # The file is UTF-8 regardless of the locale's default encoding
+        with open(export_path, 'r', encoding="utf-8") as f:
+            self.assertEqual(json.load(f)[0]['title'], "Café 数学")
+        
+        self.db.import_tasks(export_path)
+        tasks = self.db.get_all_tasks()
+        self.assertEqual(len(tasks), 2)
+        for imported in tasks:
+            self.assertEqual(imported.title, "Café 数学")
+            self.assertEqual(imported.description, "Überprüfung — ∑")
+            self.assertEqual(imported.course, "Mathématiques")
+    
+    def test_import_tasks_rolls_back_on_error(self):
+        """Test that a failing import leaves the database untouched."""
+        import_path = self.db_path + ".json"
+        self.addCleanup(os.unlink, import_path)
+        with open(import_path, 'w') as f:
+            # The second task has no title, violating the NOT NULL constraint
+            json.dump([
+                {'title': "Good Task", 'due_date': "2025-12-31T23:59:59", 'created_at': "2025-01-01T00:00:00"},
+                {'title': None, 'due_date': "2025-12-31T23:59:59", 'created_at': "2025-01-01T00:00:00"}
+            ], f)
+        
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.import_tasks(import_path)
+        self.assertEqual(len(self.db.get_all_tasks()), 0)
+    
+    def test_import_tasks_large_batch(self):
+        """Test importing more tasks than fit in a single insert batch."""
+        task_dicts = [
+            {
+                'title': f"Task {i:03d}",
+                'due_date': f"2025-12-31T23:{i // 60:02d}:{i % 60:02d}",
+                'created_at': "2025-01-01T00:00:00"
+            }
+            for i in range(250)
+        ]
+        import_path = self.db_path + ".json"
+        self.addCleanup(os.unlink, import_path)
+        with open(import_path, 'w') as f:
+            json.dump(task_dicts, f)
+        
+        self.db.import_tasks(import_path)
+        
+        tasks = self.db.get_all_tasks()
+        self.assertEqual([task.title for task in tasks], [d['title'] for d in task_dicts])
+        self.assertEqual(tasks[0].priority, "medium")
+        self.assertFalse(tasks[0].completed)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,95 @@
+"""
+Unit tests for the notifications module.
+"""
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from notifications import NotificationManager
+
+
+class RecordingNotificationManager(NotificationManager):
+    """NotificationManager that records local notifications instead of showing them."""
+    
+    def __init__(self):
+        super().__init__(config_file="nonexistent_firebase_config.json")
+        self.sent = []
+        self.sent_event = threading.Event()
+    
+    def send_local_notification(self, title: str, body: str) -> bool:
+        self.sent.append((title, body))
+        self.sent_event.set()
+        return True
+
+
+class TestNotificationManager(unittest.TestCase):
+    """Test cases for notification scheduling."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.manager = RecordingNotificationManager()
+    
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.manager.stop_notification_service()
+    
+    def test_due_notification_is_sent(self):
+        """Test that a notification due now is delivered promptly."""
+        reminder_time = (datetime.now() + timedelta(milliseconds=100)).isoformat()
+        self.manager.schedule_notification(1, reminder_time, "Reminder", "Task due")
+        
+        self.assertTrue(self.manager.sent_event.wait(timeout=5))
+        self.assertEqual(self.manager.sent, [("Reminder", "Task due")])
+        self.assertNotIn(1, self.manager.scheduled_notifications)
+    
+    def test_notification_scheduled_with_datetime(self):
+        """Test that a parsed datetime can be scheduled directly."""
+        reminder_time = datetime.now() + timedelta(milliseconds=100)
+        self.manager.schedule_notification(1, reminder_time, "Reminder", "Task due")
+        
+        self.assertTrue(self.manager.sent_event.wait(timeout=5))
+        self.assertEqual(self.manager.sent, [("Reminder", "Task due")])
+    
+    def test_cancelled_notification_is_not_sent(self):
+        """Test that cancelling a notification prevents delivery."""
+        reminder_time = (datetime.now() + timedelta(milliseconds=200)).isoformat()
+        self.manager.schedule_notification(1, reminder_time, "Cancelled", "Task due")
+        self.manager.cancel_scheduled_notification(1)
+        
+        self.assertFalse(self.manager.sent_event.wait(timeout=0.5))
+        self.assertEqual(self.manager.sent, [])
+    
+    def test_rescheduled_notification_is_sent_once(self):
+        """Test that rescheduling replaces the earlier reminder."""
+        later = (datetime.now() + timedelta(days=1)).isoformat()
+        self.manager.schedule_notification(1, later, "Old", "Task due")
+        soon = (datetime.now() + timedelta(milliseconds=100)).isoformat()
+        self.manager.schedule_notification(1, soon, "New", "Task due")
+        
+        self.assertTrue(self.manager.sent_event.wait(timeout=5))
+        self.assertEqual(self.manager.sent, [("New", "Task due")])
+        self.assertEqual(self.manager.scheduled_notifications, {})
+    
+    def test_far_future_notification_does_not_block_later_ones(self):
+        """Test that a reminder beyond the maximum wait does not stop the worker."""
+        self.manager.schedule_notification(1, "2999-01-01T00:00:00", "Far", "Task due")
+        soon = (datetime.now() + timedelta(milliseconds=100)).isoformat()
+        self.manager.schedule_notification(2, soon, "Soon", "Task due")
+        
+        self.assertTrue(self.manager.sent_event.wait(timeout=5))
+        self.assertEqual(self.manager.sent, [("Soon", "Task due")])
+        self.assertTrue(self.manager.notification_thread.is_alive())
+    
+    def test_stop_notification_service_is_prompt(self):
+        """Test that stopping the service does not wait for the next reminder."""
+        later = (datetime.now() + timedelta(days=1)).isoformat()
+        self.manager.schedule_notification(1, later, "Later", "Task due")
+        
+        stopper = threading.Thread(target=self.manager.stop_notification_service)
+        stopper.start()
+        stopper.join(timeout=5)
+        self.assertFalse(stopper.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
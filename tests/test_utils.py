@@ -4,56 +4,115 @@ Unit tests for the utils module.
 import unittest
 from datetime import datetime, timedelta
 
-from utils import format_countdown, calculate_reminder_time, parse_datetime
+from utils import (
+    countdown_parts, format_countdown, format_countdowns, calculate_reminder_datetime, calculate_reminder_time,
+    parse_datetime
+)
 
 
 class TestUtils(unittest.TestCase):
     """Test cases for utility functions."""
     
+    # Fixed reference time so countdown tests don't depend on the wall clock
+    NOW = datetime(2025, 10, 20, 12, 0)
+    
     def test_format_countdown_future_days(self):
         """Test formatting countdown with days in the future."""
         # Create a due date 5 days in the future
-        future_date = datetime.now() + timedelta(days=5)
+        future_date = self.NOW + timedelta(days=5)
         due_date_str = future_date.isoformat()
         
-        result = format_countdown(due_date_str)
-        self.assertIn("days", result)
-        self.assertIn("left", result)
+        result = format_countdown(due_date_str, now=self.NOW)
+        self.assertEqual(result, "5 days left")
     
     def test_format_countdown_future_hours(self):
         """Test formatting countdown with hours in the future."""
         # Create a due date 3 hours in the future
-        future_date = datetime.now() + timedelta(hours=3)
+        future_date = self.NOW + timedelta(hours=3)
         due_date_str = future_date.isoformat()
         
-        result = format_countdown(due_date_str)
-        self.assertIn("hours", result)
-        self.assertIn("left", result)
+        result = format_countdown(due_date_str, now=self.NOW)
+        self.assertEqual(result, "3 hours left")
     
     def test_format_countdown_future_minutes(self):
         """Test formatting countdown with minutes in the future."""
         # Create a due date 30 minutes in the future
-        future_date = datetime.now() + timedelta(minutes=30)
+        future_date = self.NOW + timedelta(minutes=30)
         due_date_str = future_date.isoformat()
         
-        result = format_countdown(due_date_str)
-        self.assertIn("minutes", result)
-        self.assertIn("left", result)
+        result = format_countdown(due_date_str, now=self.NOW)
+        self.assertEqual(result, "30 minutes left")
+    
+    def test_format_countdown_mixed_units(self):
+        """Test formatting countdown with several units and singular forms."""
+        result = format_countdown((self.NOW + timedelta(days=1, hours=2, minutes=5)).isoformat(), now=self.NOW)
+        self.assertEqual(result, "1 day, 2 hours left")
+        
+        result = format_countdown((self.NOW + timedelta(hours=1, minutes=1)).isoformat(), now=self.NOW)
+        self.assertEqual(result, "1 hour, 1 minute left")
+        
+        result = format_countdown((self.NOW + timedelta(seconds=30)).isoformat(), now=self.NOW)
+        self.assertEqual(result, "Due soon")
     
     def test_format_countdown_overdue(self):
         """Test formatting countdown for overdue tasks."""
         # Create a due date in the past
-        past_date = datetime.now() - timedelta(days=2)
+        past_date = self.NOW - timedelta(days=2)
         due_date_str = past_date.isoformat()
         
-        result = format_countdown(due_date_str)
+        result = format_countdown(due_date_str, now=self.NOW)
         self.assertEqual(result, "OVERDUE")
     
+    def test_format_countdown_default_now(self):
+        """Test that format_countdown measures from the current time by default."""
+        future_date = datetime.now() + timedelta(days=5, hours=1)
+        
+        result = format_countdown(future_date.isoformat())
+        self.assertIn("5 days", result)
+        self.assertIn("left", result)
+    
+    def test_format_countdown_datetime(self):
+        """Test formatting countdown from an already parsed datetime."""
+        future_date = self.NOW + timedelta(days=5)
+        
+        result = format_countdown(future_date, now=self.NOW)
+        self.assertEqual(result, "5 days left")
+    
     def test_format_countdown_invalid_date(self):
         """Test formatting countdown with invalid date string."""
         result = format_countdown("invalid-date")
         self.assertEqual(result, "Invalid date")
     
+    def test_countdown_parts(self):
+        """Test splitting the time left into days, hours and minutes."""
+        due_date_str = (self.NOW + timedelta(days=2, hours=4, minutes=30, seconds=59)).isoformat()
+        self.assertEqual(countdown_parts(due_date_str, now=self.NOW), (2, 4, 30, False))
+        
+        due_date = self.NOW - timedelta(minutes=1)
+        self.assertEqual(countdown_parts(due_date, now=self.NOW), (0, 0, 0, True))
+        
+        with self.assertRaises(ValueError):
+            countdown_parts("invalid-date", now=self.NOW)
+    
+    def test_format_countdowns(self):
+        """Test formatting countdowns for several due dates at once."""
+        due_date_strs = [
+            (datetime.now() + timedelta(days=5, hours=1)).isoformat(),
+            (datetime.now() - timedelta(days=2)).isoformat(),
+            "invalid-date"
+        ]
+        # Repeated due dates get the same countdown
+        due_date_strs += due_date_strs
+        
+        result = format_countdowns(due_date_strs)
+        self.assertEqual(len(result), 6)
+        self.assertIn("days", result[0])
+        self.assertIn("left", result[0])
+        self.assertEqual(result[1], "OVERDUE")
+        self.assertEqual(result[2], "Invalid date")
+        self.assertEqual(result[3:], result[:3])
+        self.assertEqual(format_countdowns([]), [])
+    
     def test_calculate_reminder_time_hours(self):
         """Test calculating reminder time with hours offset."""
         due_date = datetime.now() + timedelta(days=2)
@@ -102,6 +161,22 @@ class TestUtils(unittest.TestCase):
             delta=1  # Allow 1 second difference
         )
     
+    def test_calculate_reminder_time_unit_forms(self):
+        """Test that singular and capitalized units are accepted."""
+        due_date_str = "2025-12-31T23:59:00"
+        
+        self.assertEqual(calculate_reminder_time(due_date_str, "1 day"), "2025-12-30T23:59:00")
+        self.assertEqual(calculate_reminder_time(due_date_str, " 2 Hours "), "2025-12-31T21:59:00")
+        self.assertEqual(calculate_reminder_time(due_date_str, "1 MINUTE"), "2025-12-31T23:58:00")
+    
+    def test_calculate_reminder_datetime(self):
+        """Test calculating reminder time as a datetime."""
+        due_date_str = "2025-12-31T23:59:00"
+        
+        self.assertEqual(calculate_reminder_datetime(due_date_str, "2 days"), datetime(2025, 12, 29, 23, 59))
+        self.assertIsNone(calculate_reminder_datetime(due_date_str, "2 weeks"))
+        self.assertIsNone(calculate_reminder_datetime("invalid-date", "2 days"))
+    
     def test_calculate_reminder_time_invalid_offset(self):
         """Test calculating reminder time with invalid offset."""
         due_date = datetime.now() + timedelta(days=2)
@@ -114,6 +189,13 @@ class TestUtils(unittest.TestCase):
         # Test empty offset
         result = calculate_reminder_time(due_date_str, "")
         self.assertIsNone(result)
+        
+        # Test unknown unit and extra words
+        self.assertIsNone(calculate_reminder_time(due_date_str, "2 weeks"))
+        self.assertIsNone(calculate_reminder_time(due_date_str, "2 hours before"))
+        
+        # Test invalid due date
+        self.assertIsNone(calculate_reminder_time("invalid-date", "2 hours"))
     
     def test_parse_datetime(self):
         """Test parsing date and time strings."""
@@ -130,6 +212,21 @@ class TestUtils(unittest.TestCase):
         
         result = parse_datetime("2025-10-20", "invalid")
         self.assertEqual(result, "")
+        
+        # Well-formed but out of range
+        self.assertEqual(parse_datetime("2025-02-30", "12:00"), "")
+        self.assertEqual(parse_datetime("2025-10-20", "24:00"), "")
+        self.assertEqual(parse_datetime("2025-10-20", "12:60"), "")
+    
+    def test_parse_datetime_leap_day(self):
+        """Test that calendar validation is applied to canonical input."""
+        self.assertEqual(parse_datetime("2024-02-29", "00:00"), "2024-02-29T00:00:00")
+        self.assertEqual(parse_datetime("2025-02-29", "00:00"), "")
+    
+    def test_parse_datetime_non_padded(self):
+        """Test parsing date and time strings without zero padding."""
+        result = parse_datetime("2025-1-5", "9:05")
+        self.assertEqual(result, "2025-01-05T09:05:00")
 
 
 if __name__ == '__main__':
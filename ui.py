@@ -2,16 +2,49 @@
 GUI implementation for the Academic Deadline Tracker using Tkinter.
 """
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from datetime import datetime, date
-import json
-from typing import List, Optional
+from tkinter import ttk
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import datetime, date, timezone
+from functools import lru_cache
+import time
+from typing import Dict, List, Optional, Tuple
 
-from models import Task, DatabaseManager
-from utils import format_countdown, parse_datetime, calculate_reminder_time
+from models import Task, TaskSummary, DatabaseManager
+from utils import format_countdown, format_countdowns, parse_datetime, parse_iso_datetime, calculate_reminder_datetime
 from notifications import NotificationManager
 
 
+_EPOCH = datetime(1970, 1, 1)
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _due_timestamp(due_date: str) -> float:
+    """Seconds for a due date computed like the database's due_ts column."""
+    # Like SQLite's strftime('%s'): naive times are read as UTC, aware times
+    # are converted to UTC, and the result is truncated to whole seconds.
+    # Invalid dates are NULL in the database, which sorts first.
+    try:
+        due_dt = parse_iso_datetime(due_date)
+    except ValueError:
+        return float("-inf")
+    epoch = _EPOCH if due_dt.tzinfo is None else _UTC_EPOCH
+    return int((due_dt - epoch).total_seconds())
+
+
+def _due_date_sort_key(task: TaskSummary) -> Tuple[float, int]:
+    """Sort key matching the database order: by due_ts, then by id."""
+    return (_due_timestamp(task.due_date), task.id)
+
+
+def _insert_row(tree: ttk.Treeview, index: int, iid: int, values: Tuple[str, ...], tag: str) -> None:
+    """Insert a top-level Treeview row with a direct Tcl call."""
+    # Treeview.insert normalizes its keyword options in Python on every call;
+    # passing the Tcl arguments directly skips that for bulk refreshes
+    tree.tk.call(tree._w, "insert", "", index, "-id", iid, "-values", values, "-tags", (tag,))
+
+
 class AcademicDeadlineTrackerUI:
     """Main UI class for the Academic Deadline Tracker."""
     
@@ -23,8 +56,26 @@ class AcademicDeadlineTrackerUI:
         # Initialize components
         self.db = DatabaseManager()
         self.notification_manager = NotificationManager()
-        self.current_tasks: List[Task] = []
-        self.filtered_tasks: List[Task] = []
+        # Loaded tasks hold only the list-view columns; full tasks are fetched
+        # by id for the detail and edit views
+        self.current_tasks: List[TaskSummary] = []
+        self.filtered_tasks: List[TaskSummary] = []
+        self.current_task: Optional[Task] = None
+        self._tasks_by_id: Dict[int, TaskSummary] = {}
+        # Number of loaded tasks per course, for the course filter dropdown
+        self._course_counts: Counter = Counter()
+        # Pending `after` id for a debounced filter refresh
+        self._pending_filter_refresh: Optional[str] = None
+        # Per-task filter keys, index-aligned with current_tasks
+        self._task_courses: List[str] = []
+        self._task_priorities: List[str] = []
+        self._task_completed: List[bool] = []
+        # What the task tree currently shows, so refreshes can apply only changes
+        self._row_order: List[int] = []
+        self._row_values: Dict[int, Tuple[Tuple[str, ...], str]] = {}
+        # Countdown text per due date, valid for the wall-clock minute it was made in
+        self._countdown_minute: Optional[int] = None
+        self._countdowns: Dict[str, str] = {}
         self.dark_mode = False
         
         # Create UI
@@ -32,8 +83,10 @@ class AcademicDeadlineTrackerUI:
         self.load_tasks()
         self.update_task_list()
         
-        # Start notification service
-        self.notification_manager.start_notification_service()
+        # Start notification service once the window has had a chance to draw
+        self._pending_notification_start = self.root.after(
+            100, self.notification_manager.start_notification_service
+        )
     
     def create_widgets(self) -> None:
         """Create all UI widgets."""
@@ -77,7 +130,7 @@ class AcademicDeadlineTrackerUI:
             state="readonly"
         )
         self.course_filter_combo.pack(fill=tk.X, pady=5)
-        self.course_filter_combo.bind("<<ComboboxSelected>>", self.apply_filters)
+        self.course_filter_combo.bind("<<ComboboxSelected>>", self.schedule_apply_filters)
         
         # Priority filter
         ttk.Label(self.sidebar_frame, text="Filter by Priority:").pack(pady=(10, 0), anchor=tk.W)
@@ -89,7 +142,7 @@ class AcademicDeadlineTrackerUI:
             state="readonly"
         )
         self.priority_filter_combo.pack(fill=tk.X, pady=5)
-        self.priority_filter_combo.bind("<<ComboboxSelected>>", self.apply_filters)
+        self.priority_filter_combo.bind("<<ComboboxSelected>>", self.schedule_apply_filters)
         
         # Status filter
         ttk.Label(self.sidebar_frame, text="Filter by Status:").pack(pady=(10, 0), anchor=tk.W)
@@ -101,7 +154,7 @@ class AcademicDeadlineTrackerUI:
             state="readonly"
         )
         self.status_filter_combo.pack(fill=tk.X, pady=5)
-        self.status_filter_combo.bind("<<ComboboxSelected>>", self.apply_filters)
+        self.status_filter_combo.bind("<<ComboboxSelected>>", self.schedule_apply_filters)
         
         # Filter buttons
         ttk.Button(
@@ -191,6 +244,11 @@ class AcademicDeadlineTrackerUI:
         self.task_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # Configure tags for coloring
+        self.task_tree.tag_configure("high", background="#ffcccc")
+        self.task_tree.tag_configure("medium", background="#fff2cc")
+        self.task_tree.tag_configure("low", background="#d9ead3")
+        
         # Bind events
         self.task_tree.bind("<Double-1>", self.on_task_double_click)
     
@@ -232,43 +290,139 @@ class AcademicDeadlineTrackerUI:
     
     def load_tasks(self) -> None:
         """Load tasks from database."""
-        self.current_tasks = self.db.get_all_tasks()
+        # The database already returns this order, so the sort is a single
+        # pass; it guarantees the exact key order that store_task bisects on
+        self.current_tasks = sorted(self.db.get_task_summaries(), key=_due_date_sort_key)
+        self._tasks_by_id = {task.id: task for task in self.current_tasks}
+        self._course_counts = Counter(task.course for task in self.current_tasks if task.course)
+        self.update_filter_columns()
         self.update_course_filter()
     
+    def store_task(self, task: Task) -> None:
+        """Add or replace a saved task in the loaded list without reloading the database."""
+        previous = self._tasks_by_id.get(task.id)
+        # Summaries are immutable, so later in-place edits of `task` don't alter the list
+        stored = task.to_summary()
+        self._tasks_by_id[task.id] = stored
+        if previous is not None:
+            self._remove_current_task(previous)
+        self._insert_current_task(stored)
+        
+        courses_changed = self._count_course(task.course, 1)
+        if previous is not None:
+            courses_changed |= self._count_course(previous.course, -1)
+        if courses_changed:
+            self.update_course_filter()
+    
+    def discard_task(self, task_id: int) -> None:
+        """Remove a deleted task from the loaded list without reloading the database."""
+        previous = self._tasks_by_id.pop(task_id, None)
+        if previous is not None:
+            self._remove_current_task(previous)
+            if self._count_course(previous.course, -1):
+                self.update_course_filter()
+    
+    def _count_course(self, course: str, delta: int) -> bool:
+        """Adjust how many loaded tasks use a course; return True if the set of courses changed."""
+        if not course:
+            return False
+        count = self._course_counts[course] + delta
+        if count > 0:
+            self._course_counts[course] = count
+            return count == delta
+        del self._course_counts[course]
+        return True
+    
+    def _insert_current_task(self, task: TaskSummary) -> None:
+        """Insert a task into current_tasks and the filter columns at its due date position."""
+        index = bisect_right(self.current_tasks, _due_date_sort_key(task), key=_due_date_sort_key)
+        self.current_tasks.insert(index, task)
+        self._task_courses.insert(index, task.course)
+        self._task_priorities.insert(index, task.priority.lower())
+        self._task_completed.insert(index, bool(task.completed))
+    
+    def _remove_current_task(self, task: TaskSummary) -> None:
+        """Remove a task from current_tasks and the filter columns."""
+        # Keys include the id, so they are unique and bisect finds the task itself
+        index = bisect_left(self.current_tasks, _due_date_sort_key(task), key=_due_date_sort_key)
+        del self.current_tasks[index]
+        del self._task_courses[index]
+        del self._task_priorities[index]
+        del self._task_completed[index]
+    
+    def update_filter_columns(self) -> None:
+        """Precompute the values the filters compare against for each task."""
+        self._task_courses = [task.course for task in self.current_tasks]
+        self._task_priorities = [task.priority.lower() for task in self.current_tasks]
+        self._task_completed = [bool(task.completed) for task in self.current_tasks]
+    
     def update_course_filter(self) -> None:
         """Update the course filter dropdown with available courses."""
-        courses = list(set(task.course for task in self.current_tasks if task.course))
-        courses.insert(0, "All")
+        courses = ("All",) + tuple(sorted(self._course_counts))
         self.course_filter_combo['values'] = courses
         if self.course_filter_var.get() not in courses:
             self.course_filter_var.set("All")
     
     def update_task_list(self) -> None:
-        """Update the task list display."""
-        # Clear existing items
-        for item in self.task_tree.get_children():
-            self.task_tree.delete(item)
-        
-        # Add filtered tasks
+        """Update the task list display, touching only rows that changed."""
+        # Countdowns only change once a minute, so reuse them within a minute
+        # and format the due dates not seen yet this minute in one batch
+        minute = int(time.time() // 60)
+        if minute != self._countdown_minute:
+            self._countdown_minute = minute
+            self._countdowns = {}
+        countdowns = self._countdowns
+        missing = [task.due_date for task in self.filtered_tasks if task.due_date not in countdowns]
+        if missing:
+            countdowns.update(zip(missing, format_countdowns(missing)))
+        
+        # Build the desired rows, keyed by task id in display order
+        rows: Dict[int, Tuple[Tuple[str, ...], str]] = {}
         for task in self.filtered_tasks:
-            countdown = format_countdown(task.due_date)
+            countdown = countdowns[task.due_date]
             priority = task.priority.capitalize()
             
             # Set tag based on priority for coloring
             tag = priority.lower()
             
-            self.task_tree.insert(
-                "",
-                tk.END,
-                values=(task.title, task.course, task.due_date, priority, countdown),
-                tags=(tag,),
-                iid=task.id
-            )
-        
-        # Configure tags for coloring
-        self.task_tree.tag_configure("high", background="#ffcccc")
-        self.task_tree.tag_configure("medium", background="#fff2cc")
-        self.task_tree.tag_configure("low", background="#d9ead3")
+            rows[task.id] = ((task.title, task.course, task.due_date, priority, countdown), tag)
+        
+        # Remove rows that are no longer shown
+        removed = [task_id for task_id in self._row_order if task_id not in rows]
+        if removed:
+            self.task_tree.delete(*removed)
+        order = [task_id for task_id in self._row_order if task_id in rows]
+        
+        # Insert new rows, move rows whose position changed, and update rows
+        # whose values changed. `order` mirrors the tree as it is edited.
+        for index, (task_id, row) in enumerate(rows.items()):
+            values, tag = row
+            previous = self._row_values.get(task_id)
+            if previous is None:
+                _insert_row(self.task_tree, index, task_id, values, tag)
+                order.insert(index, task_id)
+                continue
+            
+            if order[index] != task_id:
+                self.task_tree.move(task_id, "", index)
+                order.remove(task_id)
+                order.insert(index, task_id)
+            if previous != row:
+                self.task_tree.item(task_id, values=values, tags=(tag,))
+        
+        self._row_order = order
+        self._row_values = rows
+    
+    def schedule_apply_filters(self, event=None) -> None:
+        """Apply filters after a short delay, coalescing rapid filter changes into one refresh."""
+        if self._pending_filter_refresh is not None:
+            self.root.after_cancel(self._pending_filter_refresh)
+        self._pending_filter_refresh = self.root.after(50, self._apply_scheduled_filters)
+    
+    def _apply_scheduled_filters(self) -> None:
+        """Run a filter refresh scheduled by schedule_apply_filters."""
+        self._pending_filter_refresh = None
+        self.apply_filters()
     
     def apply_filters(self, event=None) -> None:
         """Apply the selected filters to the task list."""
@@ -276,21 +430,21 @@ class AcademicDeadlineTrackerUI:
         priority_filter = self.priority_filter_var.get()
         status_filter = self.status_filter_var.get()
         
-        self.filtered_tasks = self.current_tasks.copy()
-        
-        # Apply course filter
-        if course_filter and course_filter != "All":
-            self.filtered_tasks = [task for task in self.filtered_tasks if task.course == course_filter]
+        # None means the filter is not active
+        course = course_filter if course_filter and course_filter != "All" else None
+        priority = priority_filter.lower() if priority_filter and priority_filter != "All" else None
+        completed = {"Pending": False, "Completed": True}.get(status_filter)
         
-        # Apply priority filter
-        if priority_filter and priority_filter != "All":
-            self.filtered_tasks = [task for task in self.filtered_tasks if task.priority.lower() == priority_filter.lower()]
-        
-        # Apply status filter
-        if status_filter == "Pending":
-            self.filtered_tasks = [task for task in self.filtered_tasks if not task.completed]
-        elif status_filter == "Completed":
-            self.filtered_tasks = [task for task in self.filtered_tasks if task.completed]
+        # Check all active filters in a single pass over the precomputed columns
+        self.filtered_tasks = [
+            task
+            for task, task_course, task_priority, task_completed in zip(
+                self.current_tasks, self._task_courses, self._task_priorities, self._task_completed
+            )
+            if (course is None or task_course == course)
+            and (priority is None or task_priority == priority)
+            and (completed is None or task_completed == completed)
+        ]
         
         self.update_task_list()
     
@@ -325,18 +479,21 @@ class AcademicDeadlineTrackerUI:
         
         # Display task details
         self.detail_text.delete(1.0, tk.END)
-        details = f"""Title: {task.title}
-Course: {task.course}
-Priority: {task.priority.capitalize()}
-Due Date: {task.due_date}
-Countdown: {format_countdown(task.due_date)}
-
-Description:
-{task.description}
-
-Created: {task.created_at}
-Reminder: {task.reminder_time or 'None'}
-Status: {'Completed' if task.completed else 'Pending'}"""
+        lines = (
+            f"Title: {task.title}",
+            f"Course: {task.course}",
+            f"Priority: {task.priority.capitalize()}",
+            f"Due Date: {task.due_date}",
+            f"Countdown: {format_countdown(task.due_dt or task.due_date)}",
+            "",
+            "Description:",
+            task.description or "",
+            "",
+            f"Created: {task.created_at}",
+            f"Reminder: {task.reminder_time or 'None'}",
+            f"Status: {'Completed' if task.completed else 'Pending'}"
+        )
+        details = "\n".join(lines)
         
         self.detail_text.insert(1.0, details)
         self.current_task = task
@@ -347,7 +504,7 @@ Status: {'Completed' if task.completed else 'Pending'}"""
     
     def show_edit_task_dialog(self) -> None:
         """Show dialog to edit the selected task."""
-        if hasattr(self, 'current_task'):
+        if self.current_task is not None:
             self.show_task_dialog(self.current_task)
     
     def show_task_dialog(self, task: Optional[Task] = None) -> None:
@@ -368,31 +525,22 @@ Status: {'Completed' if task.completed else 'Pending'}"""
         reminder_var = tk.StringVar(value="")
         
         # Pre-populate date and time if editing
-        if task and task.due_date:
-            try:
-                due_dt = datetime.fromisoformat(task.due_date)
-                date_var.set(due_dt.strftime("%Y-%m-%d"))
-                time_var.set(due_dt.strftime("%H:%M"))
-            except ValueError:
-                pass
-        
-        if task and task.reminder_time:
-            # Calculate offset for display
-            try:
-                due_dt = datetime.fromisoformat(task.due_date)
-                reminder_dt = datetime.fromisoformat(task.reminder_time)
-                diff = due_dt - reminder_dt
-                
-                if diff.days > 0:
-                    reminder_var.set(f"{diff.days} days")
-                elif diff.seconds >= 3600:
-                    hours = diff.seconds // 3600
-                    reminder_var.set(f"{hours} hours")
-                elif diff.seconds >= 60:
-                    minutes = diff.seconds // 60
-                    reminder_var.set(f"{minutes} minutes")
-            except ValueError:
-                pass
+        if task and task.due_dt:
+            date_var.set(task.due_dt.strftime("%Y-%m-%d"))
+            time_var.set(task.due_dt.strftime("%H:%M"))
+        
+        if task and task.due_dt and task.reminder_dt:
+            # Calculate offset for display, in whole seconds
+            offset = int((task.due_dt - task.reminder_dt).total_seconds())
+            
+            if offset >= 86400:
+                reminder_var.set(f"{offset // 86400} days")
+            elif offset >= 3600:
+                hours = offset // 3600
+                reminder_var.set(f"{hours} hours")
+            elif offset >= 60:
+                minutes = offset // 60
+                reminder_var.set(f"{minutes} minutes")
         
         # Create form
         form_frame = ttk.Frame(dialog, padding="10")
@@ -462,6 +610,8 @@ Status: {'Completed' if task.completed else 'Pending'}"""
         button_frame.pack(fill=tk.X, padx=10, pady=10)
         
         def save_task():
+            from tkinter import messagebox
+            
             # Validate input
             title = title_var.get().strip()
             if not title:
@@ -475,12 +625,14 @@ Status: {'Completed' if task.completed else 'Pending'}"""
             
             # Calculate reminder time
             reminder_offset = reminder_var.get().strip()
+            reminder_dt = None
             reminder_time = None
             if reminder_offset:
-                reminder_time = calculate_reminder_time(due_date_str, reminder_offset)
-                if not reminder_time:
+                reminder_dt = calculate_reminder_datetime(due_date_str, reminder_offset)
+                if not reminder_dt:
                     messagebox.showerror("Error", "Invalid reminder format")
                     return
+                reminder_time = reminder_dt.isoformat()
             
             # Create or update task
             if task:
@@ -492,12 +644,13 @@ Status: {'Completed' if task.completed else 'Pending'}"""
                 task.due_date = due_date_str
                 task.reminder_time = reminder_time
                 self.db.update_task(task)
+                self.store_task(task)
                 
                 # Update notification if needed
-                if reminder_time:
+                if reminder_dt:
                     self.notification_manager.schedule_notification(
                         task.id,
-                        reminder_time,
+                        reminder_dt,
                         f"Reminder: {task.title}",
                         f"Task due: {task.due_date}"
                     )
@@ -516,18 +669,18 @@ Status: {'Completed' if task.completed else 'Pending'}"""
                 )
                 task_id = self.db.add_task(new_task)
                 new_task.id = task_id
+                self.store_task(new_task)
                 
                 # Schedule notification if needed
-                if reminder_time:
+                if reminder_dt:
                     self.notification_manager.schedule_notification(
                         task_id,
-                        reminder_time,
+                        reminder_dt,
                         f"Reminder: {new_task.title}",
                         f"Task due: {new_task.due_date}"
                     )
             
             # Refresh task list
-            self.load_tasks()
             self.apply_filters()
             dialog.destroy()
         
@@ -542,37 +695,42 @@ Status: {'Completed' if task.completed else 'Pending'}"""
     
     def delete_selected_task(self) -> None:
         """Delete the selected task."""
-        if not hasattr(self, 'current_task'):
+        from tkinter import messagebox
+        
+        if self.current_task is None:
             return
         
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this task?"):
             self.db.delete_task(self.current_task.id)
             self.notification_manager.cancel_scheduled_notification(self.current_task.id)
-            self.load_tasks()
+            self.discard_task(self.current_task.id)
             self.apply_filters()
             self.detail_text.delete(1.0, tk.END)
             self.edit_btn.config(state=tk.DISABLED)
             self.delete_btn.config(state=tk.DISABLED)
             self.complete_btn.config(state=tk.DISABLED)
+            self.current_task = None
     
     def complete_selected_task(self) -> None:
         """Mark the selected task as complete or incomplete."""
-        if not hasattr(self, 'current_task'):
+        if self.current_task is None:
             return
         
-        self.current_task.completed = not self.current_task.completed
+        self.current_task.completed = int(not self.current_task.completed)
         self.db.update_task(self.current_task)
         
         if self.current_task.completed:
             # Cancel any scheduled notifications
             self.notification_manager.cancel_scheduled_notification(self.current_task.id)
         
-        self.load_tasks()
+        self.store_task(self.current_task)
         self.apply_filters()
         self.show_task_details(self.current_task.id)
     
     def export_tasks(self) -> None:
         """Export tasks to JSON file."""
+        from tkinter import filedialog, messagebox
+        
         filename = f"tasks_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         filepath = filedialog.asksaveasfilename(
             defaultextension=".json",
@@ -589,6 +747,8 @@ Status: {'Completed' if task.completed else 'Pending'}"""
     
     def import_tasks(self) -> None:
         """Import tasks from JSON file."""
+        from tkinter import filedialog, messagebox
+        
         filepath = filedialog.askopenfilename(
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
@@ -604,21 +764,29 @@ Status: {'Completed' if task.completed else 'Pending'}"""
     
     def show_calendar_view(self) -> None:
         """Show calendar view of tasks."""
+        from tkinter import messagebox
+        
         messagebox.showinfo("Calendar View", "Calendar view feature would be implemented here.")
     
     def show_settings(self) -> None:
         """Show settings dialog."""
+        from tkinter import messagebox
+        
         messagebox.showinfo("Settings", "Settings feature would be implemented here.")
     
     def toggle_dark_mode(self) -> None:
         """Toggle dark mode."""
+        from tkinter import messagebox
+        
         self.dark_mode = self.dark_mode_var.get()
         # In a full implementation, this would change the UI theme
         messagebox.showinfo("Dark Mode", "Dark mode toggle would be implemented here.")
     
     def on_closing(self) -> None:
         """Handle application closing."""
+        self.root.after_cancel(self._pending_notification_start)
         self.notification_manager.stop_notification_service()
+        self.db.close()
         self.root.destroy()
 
 
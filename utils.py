@@ -1,46 +1,192 @@
 """
 Utility functions for the Academic Deadline Tracker.
 """
+import re
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
+parse_iso_datetime: Callable[[str], datetime]
+try:
+    # C implementation of ISO 8601 parsing, used when installed
+    from ciso8601 import parse_datetime as _ciso8601_parse_datetime
+    parse_iso_datetime = _ciso8601_parse_datetime
+except ImportError:
+    parse_iso_datetime = datetime.fromisoformat
 
-def format_countdown(due_date_str: str) -> str:
+# Reminder offsets such as "48 hours", "1 day" or "30 minutes". Each unit has
+# its own group, so the unit is identified by which group matched.
+_REMINDER_OFFSET_RE = re.compile(r"^\s*(\d+)\s*(?:(minutes?)|(hours?)|(days?))\s*$", re.IGNORECASE)
+
+# Reference point for converting naive local datetimes to seconds
+_EPOCH = datetime(1970, 1, 1)
+
+# Countdowns have minute resolution, so the current time is read at most once
+# per _NOW_REFRESH seconds. Holds (monotonic reading, wall-clock seconds).
+_NOW_REFRESH = 0.1
+_now_cache: Tuple[float, float] = (float("-inf"), 0.0)
+
+# Canonical form-field input: "2025-10-20" and "23:59"
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_TIME_RE = re.compile(r"[0-9]{2}:[0-9]{2}")
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO datetime string, reusing the result for repeated strings."""
+    # datetime objects are immutable, so sharing cached results is safe
+    return parse_iso_datetime(value)
+
+
+def _wall_seconds(value: datetime) -> float:
+    """Seconds from the epoch to a naive local datetime, reading it as wall-clock time."""
+    # Treating local time as if it were UTC keeps differences equal to plain
+    # datetime subtraction, so countdowns are not shifted by DST changes
+    return (value - _EPOCH).total_seconds()
+
+
+@lru_cache(maxsize=1024)
+def _due_seconds(value: str) -> float:
+    """Wall-clock seconds for an ISO datetime string, computed once per string."""
+    return _wall_seconds(_parse_iso(value))
+
+
+def _now_seconds() -> float:
+    """Current wall-clock seconds, re-read from the clock at most every _NOW_REFRESH."""
+    global _now_cache
+    checked_at, now_seconds = _now_cache
+    monotonic = time.monotonic()
+    if monotonic - checked_at > _NOW_REFRESH:
+        now_seconds = _wall_seconds(datetime.now())
+        # Replace the tuple as a whole so other threads never see a torn pair
+        _now_cache = (monotonic, now_seconds)
+    return now_seconds
+
+
+def countdown_parts(due_date: Union[str, datetime], now: Optional[datetime] = None) -> Tuple[int, int, int, bool]:
+    """
+    Split the time left until a due date into whole days, hours and minutes.
+    
+    Args:
+        due_date: ISO format datetime string, or an already parsed datetime
+        now: Time to count down from; defaults to the current time
+        
+    Returns:
+        Tuple of (days, hours, minutes, overdue); the units are 0 when overdue
+        
+    Raises:
+        ValueError: If due_date is not a valid ISO datetime string
+    """
+    return _countdown_parts_at(due_date, _now_seconds() if now is None else _wall_seconds(now))
+
+
+def _countdown_parts_at(due_date: Union[str, datetime], now_seconds: float) -> Tuple[int, int, int, bool]:
+    """Split a countdown measured from a wall-clock time in seconds into units."""
+    if isinstance(due_date, str):
+        remaining = _due_seconds(due_date) - now_seconds
+    else:
+        remaining = _wall_seconds(due_date) - now_seconds
+    
+    if remaining < 0:
+        return (0, 0, 0, True)
+    
+    days, remainder = divmod(int(remaining), 86400)
+    hours, remainder = divmod(remainder, 3600)
+    return (days, hours, remainder // 60, False)
+
+
+def format_countdown(due_date: Union[str, datetime], now: Optional[datetime] = None) -> str:
     """
     Format a human-friendly countdown string from a due date.
     
     Args:
-        due_date_str: ISO format datetime string
+        due_date: ISO format datetime string, or an already parsed datetime
+        now: Time to count down from; defaults to the current time
         
     Returns:
         Formatted countdown string (e.g., "2 days, 4 hours left")
     """
+    return _format_countdown_at(due_date, _now_seconds() if now is None else _wall_seconds(now))
+
+
+def _format_countdown_at(due_date: Union[str, datetime], now_seconds: float) -> str:
+    """Format a countdown measured from a wall-clock time in seconds."""
     try:
-        due_date = datetime.fromisoformat(due_date_str)
-        now = datetime.now()
-        diff = due_date - now
-        
-        if diff.total_seconds() < 0:
-            return "OVERDUE"
-        
-        days = diff.days
-        hours, remainder = divmod(diff.seconds, 3600)
-        minutes, _ = divmod(remainder, 60)
-        
-        parts = []
-        if days > 0:
-            parts.append(f"{days} day{'s' if days != 1 else ''}")
+        days, hours, minutes, overdue = _countdown_parts_at(due_date, now_seconds)
+    except ValueError:
+        return "Invalid date"
+    
+    if overdue:
+        return "OVERDUE"
+    
+    # One f-string per combination of shown units, so no list is built and
+    # joined. Minutes are only shown when less than a day remains.
+    if days > 0:
         if hours > 0:
-            parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-        if minutes > 0 and days == 0:
-            parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+            return f"{days} day{'s' if days != 1 else ''}, {hours} hour{'s' if hours != 1 else ''} left"
+        return f"{days} day{'s' if days != 1 else ''} left"
+    if hours > 0:
+        if minutes > 0:
+            return f"{hours} hour{'s' if hours != 1 else ''}, {minutes} minute{'s' if minutes != 1 else ''} left"
+        return f"{hours} hour{'s' if hours != 1 else ''} left"
+    if minutes > 0:
+        return f"{minutes} minute{'s' if minutes != 1 else ''} left"
+    
+    return "Due soon"
+
+
+def format_countdowns(due_dates: List[Union[str, datetime]]) -> List[str]:
+    """
+    Format countdown strings for many due dates at once.
+    
+    All countdowns are measured from a single reading of the clock, so a list
+    rendered in one pass is consistent and the clock is not read per item.
+    Repeated due dates, common for shared deadlines, are formatted once.
+    
+    Args:
+        due_dates: ISO format datetime strings or already parsed datetimes
         
-        if not parts:
-            return "Due soon"
+    Returns:
+        Formatted countdown strings in the same order as the input
+    """
+    now_seconds = _now_seconds()
+    formatted: Dict[Union[str, datetime], str] = {}
+    countdowns = []
+    for due_date in due_dates:
+        countdown = formatted.get(due_date)
+        if countdown is None:
+            countdown = formatted[due_date] = _format_countdown_at(due_date, now_seconds)
+        countdowns.append(countdown)
+    return countdowns
+
+
+def calculate_reminder_datetime(due_date_str: str, reminder_offset: str) -> Optional[datetime]:
+    """
+    Calculate the reminder time based on due date and offset.
+    
+    Args:
+        due_date_str: ISO format datetime string
+        reminder_offset: Reminder offset (e.g., "48 hours", "30 minutes")
         
-        return ", ".join(parts) + " left"
-    except ValueError:
-        return "Invalid date"
+    Returns:
+        Reminder time as a datetime or None if invalid
+    """
+    if not reminder_offset:
+        return None
+    
+    # Parse reminder offset
+    match = _REMINDER_OFFSET_RE.match(reminder_offset)
+    if not match:
+        return None
+    
+    try:
+        due_date = _parse_iso(due_date_str)
+        value, minutes, hours, _ = match.groups()
+        seconds = int(value) * (60 if minutes else 3600 if hours else 86400)
+        return due_date - timedelta(seconds=seconds)
+    except (ValueError, OverflowError):
+        return None
 
 
 def calculate_reminder_time(due_date_str: str, reminder_offset: str) -> Optional[str]:
@@ -54,32 +200,8 @@ def calculate_reminder_time(due_date_str: str, reminder_offset: str) -> Optional
     Returns:
         ISO format datetime string for reminder time or None if invalid
     """
-    try:
-        due_date = datetime.fromisoformat(due_date_str)
-        
-        if not reminder_offset:
-            return None
-            
-        # Parse reminder offset
-        parts = reminder_offset.strip().split()
-        if len(parts) != 2:
-            return None
-            
-        value = int(parts[0])
-        unit = parts[1].lower()
-        
-        if unit.startswith('minute'):
-            reminder_time = due_date - timedelta(minutes=value)
-        elif unit.startswith('hour'):
-            reminder_time = due_date - timedelta(hours=value)
-        elif unit.startswith('day'):
-            reminder_time = due_date - timedelta(days=value)
-        else:
-            return None
-            
-        return reminder_time.isoformat()
-    except (ValueError, IndexError):
-        return None
+    reminder_time = calculate_reminder_datetime(due_date_str, reminder_offset)
+    return reminder_time.isoformat() if reminder_time else None
 
 
 def parse_datetime(date_str: str, time_str: str) -> str:
@@ -93,6 +215,16 @@ def parse_datetime(date_str: str, time_str: str) -> str:
     Returns:
         ISO format datetime string
     """
+    # Canonical input already has the shape of the ISO output, so it only
+    # needs validating; anything else goes through the lenient strptime path
+    if _DATE_RE.fullmatch(date_str) and _TIME_RE.fullmatch(time_str):
+        iso = f"{date_str}T{time_str}:00"
+        try:
+            datetime.fromisoformat(iso)
+        except ValueError:
+            return ""
+        return iso
+    
     try:
         dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
         return dt.isoformat()